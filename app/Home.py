@@ -1,6 +1,11 @@
 import streamlit as st
 
-st.set_page_config(page_title="PerformancePro OS", layout="wide")
+import bootstrap
 
-st.title("PerformancePro OS")
+started = bootstrap.start_page("PerformancePro OS", "PerformancePro OS")
 st.write("If you can see this page, the app is running.")
+
+bootstrap.page_rendered("PerformancePro OS", started)
+
+with st.expander("Startup timings"):
+    st.json(bootstrap.TIMINGS)
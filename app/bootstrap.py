@@ -0,0 +1,65 @@
+# app/bootstrap.py
+# Shared startup for Home.py and every page. Streamlit keeps imported modules
+# alive for the life of the process, so everything here runs once per process.
+import os
+import sys
+import time
+
+_IMPORT_START = time.perf_counter()
+
+# Add project root (one level up) to Python import path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import streamlit as st
+from streamlit.logger import get_logger
+
+from core.db_utils import get_db  # noqa: F401  re-exported for pages
+
+# Streamlit's logger writes to stderr at the level set by --logger.level, so
+# timings land in the server log once that level is "info".
+logger = get_logger(__name__)
+
+# Startup and first-render timings in milliseconds, shown on the Home page
+TIMINGS: dict[str, float] = {}
+
+
+def _elapsed_ms(since: float) -> float:
+    return round((time.perf_counter() - since) * 1000, 1)
+
+
+@st.cache_resource
+def startup() -> int:
+    """Create the engine and check the schema once; returns the schema version."""
+    start = time.perf_counter()
+    from db.database import check_schema
+
+    version = check_schema()
+    TIMINGS["startup"] = _elapsed_ms(start)
+    logger.info("Startup: schema v%s ready in %.1f ms", version, TIMINGS["startup"])
+    return version
+
+
+def start_page(page_title: str, title: str) -> float:
+    """Configure the page, render its title and make sure the app is started.
+
+    Returns the start time to pass to ``page_rendered``.
+    """
+    started = time.perf_counter()
+    st.set_page_config(page_title=page_title, layout="wide")
+    st.title(title)
+    startup()
+    return started
+
+
+def page_rendered(page_title: str, started: float) -> None:
+    """Record how long the first render of a page took in this process."""
+    key = f"first render {page_title}"
+    if key in TIMINGS:
+        return
+    TIMINGS[key] = _elapsed_ms(started)
+    if "bootstrap to first render" not in TIMINGS:
+        TIMINGS["bootstrap to first render"] = _elapsed_ms(_IMPORT_START)
+        logger.info("Bootstrap to first render: %.1f ms", TIMINGS["bootstrap to first render"])
+    logger.info("First render of %s: %.1f ms", page_title, TIMINGS[key])
@@ -1,27 +1,15 @@
 # app/pages/1_trade_entry.py
-import sys
-import os
-
-# Add project root (two levels up) to Python import path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
-
 import streamlit as st
 from datetime import datetime
-from db.database import SessionLocal
-from db.models import Instrument, Strategy, Tag, Trade, Session as TradeSession
 
-st.set_page_config(page_title="Trade Entry", layout="wide")
-st.title("Enter a New Trade")
+import bootstrap
+from bootstrap import get_db
+from db.models import Instrument, Strategy, Tag, Trade, Session as TradeSession
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+started = bootstrap.start_page("Trade Entry", "Enter a New Trade")
 
 # Fetch choices from the DB
-with next(get_db()) as db:
+with get_db() as db:
     instruments = db.query(Instrument).all()
     strategies = db.query(Strategy).all()
     tags = db.query(Tag).all()
@@ -50,7 +38,7 @@ with st.form("trade_form"):
 
 if submit:
     # Create and commit the Trade
-    with next(get_db()) as db:
+    with get_db() as db:
         # Map names back to objects/ids
         inst_obj = next((i for i in instruments if f"{i.symbol} ({i.name or ''})" == selected_instrument), None)
         strat_obj = next((s for s in strategies if s.name == selected_strategy), None)
@@ -81,3 +69,5 @@ if submit:
             db.add(trade)
             db.commit()
             st.success("Trade saved successfully!")
+
+bootstrap.page_rendered("Trade Entry", started)
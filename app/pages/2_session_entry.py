@@ -1,27 +1,15 @@
 # app/pages/2_session_entry.py
-import sys
-import os
-
-# Add project root (two levels up) to Python import path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
-
 import streamlit as st
 from datetime import datetime
-from db.database import SessionLocal
-from db.models import Session, Tag
 
-st.set_page_config(page_title="Session Entry", layout="wide")
-st.title("Enter a New Session")
+import bootstrap
+from bootstrap import get_db
+from db.models import Session, Tag
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+started = bootstrap.start_page("Session Entry", "Enter a New Session")
 
 # Fetch existing tags
-with next(get_db()) as db:
+with get_db() as db:
     tags = db.query(Tag).all()
 tag_names = [t.name for t in tags]
 
@@ -38,7 +26,7 @@ if submit:
     if end_time < start_time:
         st.error("End time cannot be earlier than start time.")
     else:
-        with next(get_db()) as db:
+        with get_db() as db:
             sess = Session(
                 date=date,
                 start_time=datetime.combine(date, start_time),
@@ -51,3 +39,5 @@ if submit:
             db.add(sess)
             db.commit()
             st.success(f"Session {sess.id} saved successfully!")
+
+bootstrap.page_rendered("Session Entry", started)
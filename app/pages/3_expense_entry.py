@@ -1,24 +1,12 @@
 # app/pages/3_expense_entry.py
-import sys
-import os
-
-# Add project root (two levels up) to Python import path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
-
 import streamlit as st
 from datetime import date
-from db.database import SessionLocal
-from db.models import Vendor, Expense, Evaluation, FundedAccount
 
-st.set_page_config(page_title="Expense Entry", layout="wide")
-st.title("Enter a New Expense")
+import bootstrap
+from bootstrap import get_db
+from db.models import Vendor, Expense, Evaluation, FundedAccount
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+started = bootstrap.start_page("Expense Entry", "Enter a New Expense")
 
 with st.form("expense_form"):
     exp_date = st.date_input("Expense date", value=date.today())
@@ -35,7 +23,7 @@ if submit:
     if not vendor_name:
         st.error("Vendor name is required.")
     else:
-        with SessionLocal() as db:
+        with get_db() as db:
             # Find or create the vendor
             vendor = db.query(Vendor).filter_by(name=vendor_name).first()
             if not vendor:
@@ -60,3 +48,5 @@ if submit:
             db.add(expense)
             db.commit()
         st.success("Expense saved successfully!")
+
+bootstrap.page_rendered("Expense Entry", started)
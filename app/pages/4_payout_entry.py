@@ -1,27 +1,15 @@
 # app/pages/4_payout_entry.py
-import sys
-import os
-
-# Add project root (two levels up) to Python import path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
-
 import streamlit as st
 from datetime import date
-from db.database import SessionLocal
-from db.models import FundedAccount, Payout
 
-st.set_page_config(page_title="Payout Entry", layout="wide")
-st.title("Enter a New Payout")
+import bootstrap
+from bootstrap import get_db
+from db.models import FundedAccount, Payout
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+started = bootstrap.start_page("Payout Entry", "Enter a New Payout")
 
 # Retrieve funded accounts to populate the dropdown
-with next(get_db()) as db:
+with get_db() as db:
     accounts = db.query(FundedAccount).all()
 account_options = [
     f"{acc.id} – {acc.firm} (start {acc.start_date})" for acc in accounts
@@ -42,7 +30,7 @@ if submit:
     if not firm:
         st.error("Prop firm is required.")
     else:
-        with SessionLocal() as db:
+        with get_db() as db:
             # Parse the selected account ID from the dropdown
             account_id = int(selected_account.split("–")[0].strip())
             if amount_net == 0.0:
@@ -58,3 +46,5 @@ if submit:
             db.add(payout)
             db.commit()
         st.success("Payout saved successfully!")
+
+bootstrap.page_rendered("Payout Entry", started)
@@ -1,24 +1,12 @@
 # app/pages/5_eval_and_account_entry.py
-import sys
-import os
-
-# Add project root (two levels up) to Python import path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
-
 import streamlit as st
 from datetime import date
-from db.database import SessionLocal
-from db.models import EvaluationProgram, Evaluation, FundedAccount
 
-st.set_page_config(page_title="Evaluations & Funded Accounts", layout="wide")
-st.title("Add Evaluations and Funded Accounts")
+import bootstrap
+from bootstrap import get_db
+from db.models import EvaluationProgram, Evaluation, FundedAccount
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+started = bootstrap.start_page("Evaluations & Funded Accounts", "Add Evaluations and Funded Accounts")
 
 # --- Evaluation form ---
 with st.form("evaluation_form"):
@@ -42,7 +30,7 @@ if submit_eval:
     if not program_firm or not program_model:
         st.error("Both firm and program model are required.")
     else:
-        with SessionLocal() as db:
+        with get_db() as db:
             # Find or create the evaluation program
             program = (
                 db.query(EvaluationProgram)
@@ -90,7 +78,7 @@ with st.form("funded_account_form"):
         "Current drawdown buffer", min_value=0.0, key="fa_buffer"
     )
     # Fetch existing evaluations (for optional linking)
-    with next(get_db()) as db:
+    with get_db() as db:
         evals = db.query(Evaluation).all()
     eval_options = ["None"] + [str(e.id) for e in evals]
     selected_eval = st.selectbox(
@@ -102,7 +90,7 @@ if submit_account:
     if not account_firm:
         st.error("Firm is required.")
     else:
-        with SessionLocal() as db:
+        with get_db() as db:
             eval_id = None
             if selected_eval != "None":
                 eval_id = int(selected_eval)
@@ -118,3 +106,5 @@ if submit_account:
             db.commit()
             db.refresh(funded_account)
         st.success(f"Funded account saved with ID {funded_account.id}.")
+
+bootstrap.page_rendered("Evaluations & Funded Accounts", started)
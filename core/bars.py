@@ -0,0 +1,128 @@
+# core/bars.py
+import os
+
+import numpy as np
+
+# Bar files stored in the project root, one directory per instrument symbol
+BAR_STORE_PATH = "bars"
+
+# Timestamps are minutes since the epoch; prices stay double precision so
+# excursions measured against float64 trade prices come out exact.
+TIME_DTYPE = np.int64
+PRICE_DTYPE = np.float64
+COLUMNS = ("time", "open", "high", "low", "close")
+
+
+def to_minutes(values) -> np.ndarray:
+    """Convert datetimes, ISO strings or datetime64 of any unit to epoch minutes.
+
+    Integer input is taken as minutes already and returned unchanged.
+    """
+    return np.asarray(values, dtype="datetime64[m]").astype(TIME_DTYPE)
+
+
+class Bars:
+    """Column arrays of minute bars for a single instrument, sorted by time."""
+
+    def __init__(self, time, open_, high, low, close):
+        self.time = time
+        self.open = open_
+        self.high = high
+        self.low = low
+        self.close = close
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    def window(self, start, end) -> tuple[np.ndarray, np.ndarray]:
+        """Return [start, stop) bar indices covering each start–end time span."""
+        starts = np.searchsorted(self.time, to_minutes(start), side="left")
+        stops = np.searchsorted(self.time, to_minutes(end), side="right")
+        return starts, stops
+
+
+class BarStore:
+    """Memory-mapped minute bar store keyed by instrument symbol."""
+
+    def __init__(self, root: str = BAR_STORE_PATH):
+        self.root = root
+        self._cache: dict[str, Bars] = {}
+
+    def _path(self, symbol: str, column: str) -> str:
+        return os.path.join(self.root, symbol, f"{column}.npy")
+
+    def symbols(self) -> list[str]:
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(
+            name
+            for name in os.listdir(self.root)
+            if os.path.exists(self._path(name, "time"))
+        )
+
+    def bars(self, symbol: str) -> Bars | None:
+        """Return the bars for ``symbol`` or ``None`` if none are stored."""
+        if symbol not in self._cache:
+            if not os.path.exists(self._path(symbol, "time")):
+                return None
+            arrays = [np.load(self._path(symbol, c), mmap_mode="r") for c in COLUMNS]
+            self._cache[symbol] = Bars(*arrays)
+        return self._cache[symbol]
+
+    def write(self, symbol: str, time, open_, high, low, close) -> int:
+        """Merge bars into the store for ``symbol``; later rows win on duplicate times."""
+        columns = [
+            to_minutes(time),
+            *(np.asarray(c, dtype=PRICE_DTYPE) for c in (open_, high, low, close)),
+        ]
+        existing = self.bars(symbol)
+        if existing is not None and len(existing):
+            columns = [
+                np.concatenate([np.asarray(getattr(existing, c)), new])
+                for c, new in zip(COLUMNS, columns)
+            ]
+        # Reverse before the unique pass so the most recently added row is kept
+        reversed_time = columns[0][::-1]
+        _, first = np.unique(reversed_time, return_index=True)
+        keep = len(reversed_time) - 1 - first
+
+        # Write every column to a temp file before swapping any into place, so
+        # existing memory maps keep the old files and a failed write leaves the
+        # stored columns untouched.
+        os.makedirs(os.path.join(self.root, symbol), exist_ok=True)
+        temp_paths = []
+        try:
+            for column, values in zip(COLUMNS, columns):
+                temp_path = self._path(symbol, f"{column}.tmp")
+                temp_paths.append(temp_path)
+                np.save(temp_path, values[keep])
+            for column, temp_path in zip(COLUMNS, temp_paths):
+                os.replace(temp_path, self._path(symbol, column))
+        finally:
+            for temp_path in temp_paths:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+        self._cache.pop(symbol, None)
+        return len(keep)
+
+    def load_csv(self, symbol: str, path: str) -> int:
+        """Bulk load a CSV with timestamp, open, high, low and close columns."""
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            header = [h.strip().lower() for h in f.readline().split(",")]
+            time_name = "time" if "time" in header else "timestamp"
+            usecols = []
+            for name in (time_name, *COLUMNS[1:]):
+                if name not in header:
+                    raise ValueError(f"{path}: missing '{name}' column")
+                usecols.append(header.index(name))
+            data = np.loadtxt(
+                f,
+                delimiter=",",
+                dtype=[("time", "U32")] + [(c, np.float64) for c in COLUMNS[1:]],
+                usecols=usecols,
+                ndmin=1,
+            )
+        if not len(data):
+            return len(self.bars(symbol) or [])
+        time = to_minutes(np.char.strip(data["time"]))
+        return self.write(symbol, time, *(data[c] for c in COLUMNS[1:]))
@@ -0,0 +1,121 @@
+# core/excursions.py
+from collections import defaultdict
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from core.bars import BarStore
+from db.models import Trade, TradeExcursion
+
+
+def _window_extremes(values: np.ndarray, starts: np.ndarray, stops: np.ndarray, ufunc):
+    """Reduce ``values`` over each [start, stop) window with ``ufunc.reduceat``.
+
+    Only the span covered by the windows is read, in the stored dtype. Empty
+    windows come back as NaN.
+    """
+    result = np.full(len(starts), np.nan)
+    nonempty = stops > starts
+    if not nonempty.any():
+        return result
+    lo = starts[nonempty].min()
+    span = values[lo : stops[nonempty].max()]
+    first = starts[nonempty] - lo
+    last = stops[nonempty] - 1 - lo
+    # Interleave first/last so every even reduceat slot covers [first, last);
+    # the last bar is folded in afterwards, which keeps every index in range.
+    indices = np.empty(2 * len(first), dtype=np.intp)
+    indices[0::2] = first
+    indices[1::2] = last
+    result[nonempty] = ufunc(ufunc.reduceat(span, indices)[0::2], span[last])
+    return result
+
+
+def compute_excursions(trades: list[Trade], store: BarStore) -> dict[int, dict[str, float]]:
+    """Compute MAE, MFE and exit efficiency per trade, in price points.
+
+    MAE and MFE are the largest adverse and favorable moves from the entry
+    price over the bars between ``entry_time`` and ``exit_time``, widened to
+    include the exit price itself. Efficiency is the captured move divided by
+    MFE, clamped to [-1, 1]: 1 exits at the best price, 0 at break-even and -1
+    gives back at least as much as the trade ever showed. Trades missing an
+    instrument, direction, times or prices, or without bars covering their
+    window, are skipped.
+    """
+    by_symbol: dict[str, list[Trade]] = defaultdict(list)
+    for trade in trades:
+        if (
+            trade.instrument is None
+            or trade.direction not in ("LONG", "SHORT")
+            or trade.entry_time is None
+            or trade.exit_time is None
+            or trade.entry_price is None
+            or trade.exit_price is None
+        ):
+            continue
+        by_symbol[trade.instrument.symbol].append(trade)
+
+    results: dict[int, dict[str, float]] = {}
+    for symbol, group in by_symbol.items():
+        bars = store.bars(symbol)
+        if bars is None or not len(bars):
+            continue
+
+        starts, stops = bars.window(
+            [t.entry_time for t in group], [t.exit_time for t in group]
+        )
+        high = _window_extremes(bars.high, starts, stops, np.maximum)
+        low = _window_extremes(bars.low, starts, stops, np.minimum)
+
+        entry = np.array([t.entry_price for t in group], dtype=np.float64)
+        exit_ = np.array([t.exit_price for t in group], dtype=np.float64)
+        long = np.array([t.direction == "LONG" for t in group])
+
+        favorable = np.where(long, high - entry, entry - low)
+        adverse = np.where(long, entry - low, high - entry)
+        captured = np.where(long, exit_ - entry, entry - exit_)
+        mfe = np.maximum(np.maximum(favorable, captured), 0.0)
+        mae = np.maximum(np.maximum(adverse, -captured), 0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            efficiency = np.clip(np.where(mfe > 0, captured / mfe, 0.0), -1.0, 1.0)
+
+        for i, trade in enumerate(group):
+            if stops[i] <= starts[i]:
+                continue
+            results[trade.id] = {
+                "mae": float(mae[i]),
+                "mfe": float(mfe[i]),
+                "efficiency": float(efficiency[i]),
+                "bar_count": int(stops[i] - starts[i]),
+            }
+    return results
+
+
+def store_excursions(session: Session, store: BarStore, trades: list[Trade] | None = None) -> int:
+    """Compute excursions and save them per trade. Returns the number saved.
+
+    Trades that no longer produce a result drop their stored excursion.
+    """
+    if trades is None:
+        trades = session.query(Trade).all()
+    results = compute_excursions(trades, store)
+
+    trade_ids = [trade.id for trade in trades]
+    existing = {
+        e.trade_id: e
+        for e in session.query(TradeExcursion)
+        .filter(TradeExcursion.trade_id.in_(trade_ids))
+        .all()
+    } if trade_ids else {}
+    for trade_id, excursion in existing.items():
+        if trade_id not in results:
+            session.delete(excursion)
+    for trade_id, values in results.items():
+        excursion = existing.get(trade_id)
+        if excursion is None:
+            excursion = TradeExcursion(trade_id=trade_id)
+            session.add(excursion)
+        for key, value in values.items():
+            setattr(excursion, key, value)
+    session.commit()
+    return len(results)
@@ -1,8 +1,9 @@
 from datetime import datetime
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from db.models import (
     Trade,
+    TradeExcursion,
     Session as TradeSession,
     Expense,
     Payout,
@@ -94,3 +95,43 @@ def pass_rates(session: Session) -> dict[str, float]:
     )
 
     return {"pass_rate": pass_rate, "total_funding": total_funding}
+
+
+def _average(values: list[float | None]) -> float:
+    present = [value for value in values if value is not None]
+    return sum(present) / len(present) if present else 0.0
+
+
+def _excursion_summary(excursions: list[TradeExcursion]) -> dict[str, int | float]:
+    return {
+        "trades": len(excursions),
+        "avg_mae": _average([e.mae for e in excursions]),
+        "avg_mfe": _average([e.mfe for e in excursions]),
+        "avg_efficiency": _average([e.efficiency for e in excursions]),
+    }
+
+
+def excursion_metrics(
+    session: Session, by: str = "strategy"
+) -> dict[str, dict[str, int | float]]:
+    """Aggregate stored MAE/MFE/efficiency by ``"strategy"`` or ``"tag"``."""
+    if by not in ("strategy", "tag"):
+        raise ValueError(f"Unknown grouping: {by}")
+
+    load_trade = joinedload(TradeExcursion.trade)
+    excursions = (
+        session.query(TradeExcursion)
+        .options(load_trade.joinedload(Trade.strategy), load_trade.selectinload(Trade.tags))
+        .all()
+    )
+    groups: dict[str, list[TradeExcursion]] = {}
+    for excursion in excursions:
+        trade = excursion.trade
+        if by == "strategy":
+            keys = [trade.strategy.name if trade.strategy else "Unassigned"]
+        else:
+            keys = [tag.name for tag in trade.tags] or ["Untagged"]
+        for key in keys:
+            groups.setdefault(key, []).append(excursion)
+
+    return {key: _excursion_summary(group) for key, group in groups.items()}
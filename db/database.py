@@ -1,14 +1,60 @@
 # db/database.py
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from sqlalchemy.orm import sessionmaker
 from .models import Base
 
 # SQLite database stored in the project root
 DATABASE_URL = "sqlite:///performancepro.db"
 
+# Bump whenever models.py changes; stored in SQLite's user_version pragma.
+# Upgrades only create new tables; changed tables need a manual migration.
+SCHEMA_VERSION = 2
+
 engine = create_engine(DATABASE_URL, echo=False)
 SessionLocal = sessionmaker(bind=engine)
 
+def schema_version() -> int:
+    """Return the schema version recorded in the database (0 if never set)."""
+    with engine.connect() as conn:
+        return conn.exec_driver_sql("PRAGMA user_version").scalar() or 0
+
 def init_db() -> None:
-    """Create all tables defined in models.py."""
+    """Create all tables defined in models.py and record the schema version."""
     Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+def missing_columns() -> dict[str, list[str]]:
+    """Return model columns absent from existing tables, keyed by table name."""
+    inspector = inspect(engine)
+    existing = set(inspector.get_table_names())
+    missing = {}
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing:
+            continue
+        live = {column["name"] for column in inspector.get_columns(table.name)}
+        absent = [column.name for column in table.columns if column.name not in live]
+        if absent:
+            missing[table.name] = absent
+    return missing
+
+def check_schema() -> int:
+    """Create new tables for an older database and return the schema version.
+
+    Raises RuntimeError if the database is newer than the app, or if an
+    existing table lacks model columns and needs a manual migration.
+    """
+    version = schema_version()
+    if version > SCHEMA_VERSION:
+        raise RuntimeError(
+            f"Database schema version {version} is newer than this app ({SCHEMA_VERSION})."
+        )
+    if version < SCHEMA_VERSION:
+        missing = missing_columns()
+        if missing:
+            raise RuntimeError(
+                f"Database schema version {version} needs a manual migration: "
+                f"missing columns {missing}."
+            )
+        init_db()
+    return SCHEMA_VERSION
@@ -1,6 +1,6 @@
 # db/init_db.py
-from db.database import init_db
+from db.database import SCHEMA_VERSION, init_db
 
 if __name__ == "__main__":
     init_db()
-    print("Database initialized.")
+    print(f"Database initialized (schema version {SCHEMA_VERSION}).")
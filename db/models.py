@@ -74,6 +74,19 @@ class Trade(Base):
     instrument = relationship("Instrument")
     strategy = relationship("Strategy")
     tags = relationship("Tag", secondary=trade_tags, back_populates="trades")
+    excursion = relationship(
+        "TradeExcursion", back_populates="trade", uselist=False, cascade="all, delete-orphan"
+    )
+
+class TradeExcursion(Base):
+    __tablename__ = "trade_excursions"
+    id = Column(Integer, primary_key=True)
+    trade_id = Column(Integer, ForeignKey("trades.id"), unique=True, nullable=False)
+    mae = Column(Float)
+    mfe = Column(Float)
+    efficiency = Column(Float)
+    bar_count = Column(Integer)
+    trade = relationship("Trade", back_populates="excursion")
 
 class Tag(Base):
     __tablename__ = "tags"
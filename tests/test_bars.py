@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from core.bars import BarStore, to_minutes
+
+
+def _write(store, times, highs):
+    highs = np.asarray(highs, dtype=float)
+    return store.write("ES", to_minutes(times), highs, highs, highs - 1, highs)
+
+
+def test_write_merges_sorted_and_keeps_last_duplicate(tmp_path):
+    store = BarStore(str(tmp_path))
+    _write(store, ["2024-01-02T09:31", "2024-01-02T09:30"], [2.0, 1.0])
+    count = _write(store, ["2024-01-02T09:31", "2024-01-02T09:32"], [5.0, 6.0])
+
+    bars = store.bars("ES")
+    assert count == 3
+    assert list(bars.time) == list(to_minutes(["2024-01-02T09:30", "2024-01-02T09:31", "2024-01-02T09:32"]))
+    assert list(bars.high) == [1.0, 5.0, 6.0]
+
+
+def test_write_leaves_existing_handles_unchanged(tmp_path):
+    store = BarStore(str(tmp_path))
+    _write(store, ["2024-01-02T09:33", "2024-01-02T09:34"], [3.0, 4.0])
+    before = store.bars("ES")
+    _write(store, ["2024-01-02T09:30", "2024-01-02T09:31", "2024-01-02T09:32"], [0.0, 1.0, 2.0])
+
+    assert list(before.high) == [3.0, 4.0]
+    assert list(BarStore(str(tmp_path)).bars("ES").high) == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert sorted(p.name for p in (tmp_path / "ES").iterdir()) == [
+        "close.npy", "high.npy", "low.npy", "open.npy", "time.npy"
+    ]
+
+
+def test_load_csv_skips_blank_lines(tmp_path):
+    path = tmp_path / "es.csv"
+    path.write_text(
+        "Timestamp,Open,High,Low,Close\n"
+        "2024-01-02 09:30:45,1,2,0.5,1.5\n"
+        "\n"
+        "2024-01-02T09:31,1.5,3,1,2.5\n"
+    )
+    store = BarStore(str(tmp_path / "bars"))
+
+    assert store.load_csv("ES", str(path)) == 2
+    assert list(store.bars("ES").high) == [2.0, 3.0]
+    assert store.bars("ES").time[0] == to_minutes("2024-01-02T09:30")
+
+
+def test_load_csv_names_missing_column(tmp_path):
+    path = tmp_path / "es.csv"
+    path.write_text("time,open,high,close\n2024-01-02T09:30,1,2,1.5\n")
+
+    with pytest.raises(ValueError, match="'low'"):
+        BarStore(str(tmp_path / "bars")).load_csv("ES", str(path))
+
+
+def test_write_converts_datetime64_to_minutes(tmp_path):
+    store = BarStore(str(tmp_path))
+    _write(store, np.array(["2024-01-02T09:30"], dtype="datetime64[ns]"), [1.0])
+
+    assert list(store.bars("ES").time) == [28403130]
+
+
+def test_load_csv_accepts_utf8_bom(tmp_path):
+    path = tmp_path / "es.csv"
+    path.write_bytes("timestamp,open,high,low,close\n2024-01-02T09:30,1,2,0.5,1.5\n".encode("utf-8-sig"))
+
+    assert BarStore(str(tmp_path / "bars")).load_csv("ES", str(path)) == 1
@@ -0,0 +1,35 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from db import database
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    monkeypatch.setattr(database, "engine", engine)
+    return engine
+
+
+def test_check_schema_creates_tables_and_stamps_version(engine):
+    assert database.schema_version() == 0
+    assert database.check_schema() == database.SCHEMA_VERSION
+    assert database.schema_version() == database.SCHEMA_VERSION
+
+
+def test_check_schema_rejects_changed_tables(engine):
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE strategies (id INTEGER PRIMARY KEY, name VARCHAR)")
+
+    with pytest.raises(RuntimeError, match="description"):
+        database.check_schema()
+    assert database.schema_version() == 0
+
+
+def test_check_schema_rejects_newer_database(engine):
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f"PRAGMA user_version = {database.SCHEMA_VERSION + 1}")
+
+    with pytest.raises(RuntimeError, match="newer"):
+        database.check_schema()
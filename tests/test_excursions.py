@@ -0,0 +1,144 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from core.bars import BarStore, to_minutes
+from core.excursions import _window_extremes, compute_excursions, store_excursions
+from core.metrics import excursion_metrics
+from db.models import Base, Instrument, Strategy, Tag, Trade, TradeExcursion
+
+VALUES = np.array([5.0, 1.0, 7.0, 3.0, 9.0, 2.0], dtype=np.float32)
+
+
+def _brute(values, starts, stops, reduce):
+    return [reduce(values[s:e]) if e > s else np.nan for s, e in zip(starts, stops)]
+
+
+@pytest.mark.parametrize(
+    "starts, stops",
+    [
+        ([0, 2, 4], [2, 4, 6]),  # adjacent, last window ends at the final bar
+        ([0, 1, 3], [5, 4, 6]),  # overlapping
+        ([4, 0, 2], [6, 3, 5]),  # out of order
+        ([3, 1, 5], [3, 2, 6]),  # empty and single-bar windows
+        ([2, 2], [2, 2]),  # all empty
+    ],
+)
+def test_window_extremes_matches_slices(starts, stops):
+    starts, stops = np.array(starts), np.array(stops)
+    high = _window_extremes(VALUES, starts, stops, np.maximum)
+    low = _window_extremes(VALUES, starts, stops, np.minimum)
+
+    np.testing.assert_array_equal(high, _brute(VALUES, starts, stops, np.max))
+    np.testing.assert_array_equal(low, _brute(VALUES, starts, stops, np.min))
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as session:
+        yield session
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = BarStore(str(tmp_path))
+    times = to_minutes([f"2024-01-02T09:{m}" for m in range(30, 36)])
+    highs = np.array([101, 103, 104, 102, 101, 100], dtype=float)
+    lows = np.array([99, 100, 102, 98, 97, 99], dtype=float)
+    store.write("ES", times, highs, highs, lows, lows)
+    return store
+
+
+def _trade(db, trade_id, direction, entry, exit_, start=30, end=33, strategy=None, tags=()):
+    instrument = db.query(Instrument).filter_by(symbol="ES").first() or Instrument(symbol="ES")
+    trade = Trade(
+        id=trade_id,
+        instrument=instrument,
+        strategy=strategy,
+        direction=direction,
+        entry_price=entry,
+        exit_price=exit_,
+        entry_time=datetime(2024, 1, 2, 9, start, 15),
+        exit_time=datetime(2024, 1, 2, 9, end, 40),
+        tags=list(tags),
+    )
+    db.add(trade)
+    return trade
+
+
+def test_compute_excursions(db, store):
+    trades = [
+        _trade(db, 1, "LONG", 100.0, 103.0),
+        _trade(db, 2, "SHORT", 102.0, 98.0),
+        _trade(db, 3, "LONG", 100.0, 90.0),  # exit below every bar
+        _trade(db, 4, None, 100.0, 101.0),
+        _trade(db, 5, "LONG", 100.0, None),
+        _trade(db, 6, "LONG", 100.0, 101.0, start=40, end=45),  # no bars
+    ]
+    results = compute_excursions(trades, store)
+
+    assert set(results) == {1, 2, 3}
+    assert results[1] == {"mae": 2.0, "mfe": 4.0, "efficiency": 0.75, "bar_count": 4}
+    assert results[2] == {"mae": 2.0, "mfe": 4.0, "efficiency": 1.0, "bar_count": 4}
+    assert results[3]["mae"] == 10.0
+    assert results[3]["efficiency"] == -1.0
+
+
+def test_compute_excursions_keeps_prices_exact(db, tmp_path):
+    # 65432.17 and 65400.01 have no exact float32 representation
+    store = BarStore(str(tmp_path))
+    store.write("ES", to_minutes(["2024-01-02T09:30"]), [65410.0], [65432.17], [65400.01], [65420.0])
+    trades = [
+        _trade(db, 1, "LONG", 65400.01, 65432.17, start=30, end=30),
+        _trade(db, 2, "LONG", 65400.01, 65420.0, start=30, end=30),
+    ]
+    results = compute_excursions(trades, store)
+
+    assert results[1]["mfe"] == 65432.17 - 65400.01
+    assert results[1]["efficiency"] == 1.0
+    assert results[2]["mae"] == 0.0
+
+
+def test_excursion_metrics_by_strategy_and_tag(db, store):
+    scalp = Strategy(name="Scalp")
+    tag = Tag(name="A+")
+    _trade(db, 1, "LONG", 100.0, 103.0, strategy=scalp, tags=[tag])
+    _trade(db, 2, "SHORT", 102.0, 98.0, strategy=scalp)
+    _trade(db, 3, "LONG", 100.0, None, strategy=scalp)
+    db.commit()
+
+    assert store_excursions(db, store) == 2
+    by_strategy = excursion_metrics(db)
+    by_tag = excursion_metrics(db, by="tag")
+
+    assert by_strategy["Scalp"] == {
+        "trades": 2, "avg_mae": 2.0, "avg_mfe": 4.0, "avg_efficiency": 0.875
+    }
+    assert by_tag["A+"]["avg_efficiency"] == 0.75
+    assert by_tag["Untagged"]["trades"] == 1
+
+
+def test_store_excursions_drops_stale_rows(db, store):
+    trade = _trade(db, 1, "LONG", 100.0, 103.0)
+    db.commit()
+    assert store_excursions(db, store) == 1
+
+    trade.exit_price = None
+    db.commit()
+    assert store_excursions(db, store) == 0
+    assert db.query(TradeExcursion).count() == 0
+
+
+def test_deleting_trade_deletes_its_excursion(db, store):
+    trade = _trade(db, 1, "LONG", 100.0, 103.0)
+    db.commit()
+    store_excursions(db, store)
+
+    db.delete(trade)
+    db.commit()
+    assert db.query(TradeExcursion).count() == 0